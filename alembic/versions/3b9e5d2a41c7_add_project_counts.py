@@ -0,0 +1,103 @@
+"""add project counts
+
+Revision ID: 3b9e5d2a41c7
+Revises: 7cb6a4cde188
+Create Date: 2026-10-15 20:15:02.318406
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e5d2a41c7'
+down_revision: Union[str, Sequence[str], None] = '7cb6a4cde188'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'project_counts',
+        sa.Column('key', sa.String(length=32), nullable=False),
+        sa.Column('n', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION project_counts_trg() RETURNS trigger AS $$
+        DECLARE
+            added text[] := '{}';
+            removed text[] := '{}';
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                added := ARRAY(SELECT status::text FROM new_rows);
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                removed := ARRAY(SELECT status::text FROM old_rows);
+            END IF;
+            WITH delta AS (
+                SELECT key, SUM(d) AS d
+                FROM (
+                    SELECT unnest(added) AS key, 1 AS d
+                    UNION ALL
+                    SELECT unnest(removed), -1
+                    UNION ALL
+                    SELECT '*', cardinality(added) - cardinality(removed)
+                ) s
+                GROUP BY key
+            )
+            INSERT INTO project_counts AS c (key, n)
+            SELECT key, d
+            FROM delta
+            WHERE d <> 0
+               OR (key = '*' AND EXISTS (SELECT 1 FROM delta WHERE d <> 0))
+            ORDER BY key <> '*', key
+            ON CONFLICT (key) DO UPDATE SET n = c.n + EXCLUDED.n;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER project_counts_ins
+        AFTER INSERT ON projects
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER project_counts_upd
+        AFTER UPDATE ON projects
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER project_counts_del
+        AFTER DELETE ON projects
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO project_counts (key, n)
+        SELECT status::text, COUNT(*) FROM projects GROUP BY status
+        UNION ALL
+        SELECT '*', COUNT(*) FROM projects
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP FUNCTION IF EXISTS project_counts_trg() CASCADE')
+    op.drop_table('project_counts')
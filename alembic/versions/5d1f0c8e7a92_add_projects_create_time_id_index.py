@@ -0,0 +1,32 @@
+"""add projects create_time id index
+
+Revision ID: 5d1f0c8e7a92
+Revises: 3b9e5d2a41c7
+Create Date: 2026-10-15 22:41:37.502114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f0c8e7a92'
+down_revision: Union[str, Sequence[str], None] = '3b9e5d2a41c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_projects_create_time_id',
+        'projects',
+        ['create_time', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_create_time_id', table_name='projects')
@@ -21,9 +21,9 @@ from core.constants import (
     PASSWORD_MIN_LENGTH,
     USERNAME_MAX_LENGTH,
     USERNAME_MIN_LENGTH,
-    USERNAME_RE,
 )
 from utils.validators import (
+    is_valid_username,
     validate_full_name_value,
     validate_password_value,
     validate_username_value,
@@ -49,7 +49,7 @@ class LoginRequest(BaseModel):
         if '@' in normalized:
             validate_email(normalized)
             return normalized
-        if not USERNAME_RE.fullmatch(normalized):
+        if not is_valid_username(normalized):
             raise ValueError(
                 'login должен быть username (латиница/цифры/._-) '
                 'или корректный e-mail'
@@ -81,7 +81,7 @@ class RegisterRequest(BaseModel):
     @field_validator('username')
     @classmethod
     def validate_username(cls, v: str) -> str:
-        return validate_username_value(v, USERNAME_RE)
+        return validate_username_value(v)
 
     @field_validator('full_name')
     @classmethod
@@ -1,11 +1,15 @@
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
     func,
 )
 from sqlalchemy import (
@@ -37,9 +41,15 @@ class Project(Base):
         description TEXT,
         person_in_charge INTEGER REFERENCES users(id)
     );
+
+    CREATE INDEX ix_projects_create_time_id ON projects (create_time, id);
     """
 
     __tablename__ = 'projects'
+    # keyset-пагинация списка: (create_time, id) < / > курсора
+    __table_args__ = (
+        Index('ix_projects_create_time_id', 'create_time', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(
@@ -72,3 +82,109 @@ class Project(Base):
         return (
             f'<Project(id={self.id}, name={self.name}, status={self.status})>'
         )
+
+
+class ProjectCount(Base):
+    """
+    Счётчики проектов, поддерживаемые триггером на таблице projects:
+    key = метка статуса (например, 'NEW') или '*' для общего количества.
+
+    SQL schema:
+
+    CREATE TABLE project_counts (
+        key VARCHAR(32) PRIMARY KEY,
+        n BIGINT NOT NULL DEFAULT 0
+    );
+    """
+
+    __tablename__ = 'project_counts'
+
+    TOTAL_KEY = '*'
+
+    key: Mapped[str] = mapped_column(String(32), primary_key=True)
+    n: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default='0'
+    )
+
+
+# Счётчики обновляются триггерами уровня оператора: дельты по всем
+# строкам оператора агрегируются по ключу и применяются одним upsert в
+# фиксированном порядке ('*' всегда первым). Так конкурентные транзакции
+# блокируют строки project_counts в одном порядке и не ловят deadlock.
+_PROJECT_COUNTS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION project_counts_trg() RETURNS trigger AS $$
+DECLARE
+    added text[] := '{}';
+    removed text[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        added := ARRAY(SELECT status::text FROM new_rows);
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        removed := ARRAY(SELECT status::text FROM old_rows);
+    END IF;
+    WITH delta AS (
+        SELECT key, SUM(d) AS d
+        FROM (
+            SELECT unnest(added) AS key, 1 AS d
+            UNION ALL
+            SELECT unnest(removed), -1
+            UNION ALL
+            SELECT '*', cardinality(added) - cardinality(removed)
+        ) s
+        GROUP BY key
+    )
+    INSERT INTO project_counts AS c (key, n)
+    SELECT key, d
+    FROM delta
+    WHERE d <> 0
+       OR (key = '*' AND EXISTS (SELECT 1 FROM delta WHERE d <> 0))
+    ORDER BY key <> '*', key
+    ON CONFLICT (key) DO UPDATE SET n = c.n + EXCLUDED.n;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Переходные таблицы нельзя объявить у триггера на несколько событий или
+# со списком колонок, поэтому триггеров три, а UPDATE без смены статуса
+# даёт нулевые дельты и ничего не блокирует.
+_PROJECT_COUNTS_TRIGGERS_SQL: tuple[str, ...] = (
+    """
+    CREATE TRIGGER project_counts_ins
+    AFTER INSERT ON projects
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+    """,
+    """
+    CREATE TRIGGER project_counts_upd
+    AFTER UPDATE ON projects
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+    """,
+    """
+    CREATE TRIGGER project_counts_del
+    AFTER DELETE ON projects
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counts_trg()
+    """,
+)
+_DROP_PROJECT_COUNTS_FUNCTION_SQL = (
+    'DROP FUNCTION IF EXISTS project_counts_trg() CASCADE'
+)
+
+# create_all/drop_all (например, в тестах) создают и удаляют триггеры
+# так же, как миграция; события таблицы срабатывают, только когда она
+# действительно создаётся или удаляется, поэтому повторный create_all
+# не пытается создать триггеры заново
+for _sql in (_PROJECT_COUNTS_FUNCTION_SQL, *_PROJECT_COUNTS_TRIGGERS_SQL):
+    event.listen(
+        Project.__table__,
+        'after_create',
+        DDL(_sql).execute_if(dialect='postgresql'),
+    )
+event.listen(
+    Project.__table__,
+    'after_drop',
+    DDL(_DROP_PROJECT_COUNTS_FUNCTION_SQL).execute_if(dialect='postgresql'),
+)
@@ -1,19 +1,74 @@
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Iterable, Sequence
 
-from sqlalchemy import Select, func, select
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from apps.project.models import Project
+from apps.project.models import Project, ProjectCount
 from apps.project.schemas import (
     ProjectCreate,
     ProjectRead,
     ProjectsPage,
     ProjectUpdate,
 )
-from apps.project.types import OrderField
-from core.constants import PAGE_DEFAULT, PER_PAGE_DEFAULT, PER_PAGE_MAX
+from apps.project.types import OrderField, ProjectStatus
+from core.constants import (
+    BULK_COPY_THRESHOLD,
+    NAME_MAX_LENGTH,
+    PAGE_DEFAULT,
+    PER_PAGE_DEFAULT,
+    PER_PAGE_MAX,
+)
+from utils.cursor import encode_cursor
+
+# Поля ProjectRead совпадают с именами колонок модели Project.
+_READ_FIELDS: tuple[str, ...] = tuple(ProjectRead.model_fields)
+_READ_LIST_ADAPTER = TypeAdapter(list[ProjectRead])
+
+# промежуточная таблица для загрузки больших пачек через COPY
+_COPY_TABLE = table(
+    'projects_copy',
+    column('ord'),
+    column('name'),
+    column('status'),
+    column('description'),
+    column('person_in_charge'),
+)
+
+_ORDER_COLS = MappingProxyType(
+    {
+        'create_time': Project.create_time,
+        'start_time': Project.start_time,
+        'complete_time': Project.complete_time,
+    }
+)
+
+
+@lru_cache(maxsize=len(_ORDER_COLS) * 2)
+def _order_clause(order_by: str, desc: bool) -> tuple[ColumnElement, ...]:
+    col = _ORDER_COLS.get(order_by, Project.create_time)
+    if desc:
+        return col.desc(), Project.id.desc()
+    return col.asc(), Project.id.asc()
 
 
 class ProjectRepository:
@@ -28,11 +83,11 @@ class ProjectRepository:
 
     @staticmethod
     def _apply_filters(
-        stmt: Select[tuple[Project]],
+        stmt: Select,
         *,
         status: str | None,
         person_id: int | None,
-    ) -> Select[tuple[Project]]:
+    ) -> Select:
         """
         SQL:
         WHERE (:status IS NULL OR projects.status = :status)
@@ -47,14 +102,39 @@ class ProjectRepository:
 
     @staticmethod
     def _apply_order(
-        stmt: Select[tuple[Project]], *, order_by: OrderField, desc: bool
-    ) -> Select[tuple[Project]]:
-        col = {
-            'create_time': Project.create_time,
-            'start_time': Project.start_time,
-            'complete_time': Project.complete_time,
-        }.get(order_by, Project.create_time)
-        return stmt.order_by(col.desc() if desc else col.asc())
+        stmt: Select, *, order_by: OrderField, desc: bool
+    ) -> Select:
+        return stmt.order_by(*_order_clause(order_by, desc))
+
+    @staticmethod
+    def _count_key(status: str | None, person_id: int | None) -> str | None:
+        """Ключ предрассчитанного счётчика в project_counts, если он есть."""
+        if person_id:
+            return None
+        if not status:
+            return ProjectCount.TOTAL_KEY
+        try:
+            return ProjectStatus(status).name
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _rows_to_schema(rows: Sequence[Row]) -> list[ProjectRead]:
+        # данные из БД доверенные — собираем схемы без повторной валидации
+        return [
+            ProjectRead.model_construct(
+                **{f: row._mapping[f] for f in _READ_FIELDS}
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _next_cursor(
+        items: list[ProjectRead], *, order_by: OrderField, has_next: bool
+    ) -> str | None:
+        if not has_next or order_by != 'create_time' or not items:
+            return None
+        return encode_cursor(items[-1].create_time, items[-1].id)
 
     # --------------------------- queries ---------------------------
 
@@ -67,7 +147,10 @@ class ProjectRepository:
         LIMIT 1;
         """
         res = await self.session.execute(
-            select(Project).where(Project.id == project_id).limit(1)
+            select(Project)
+            .where(Project.id == project_id)
+            .options(raiseload('*'))
+            .limit(1)
         )
         obj = res.scalar_one_or_none()
         return self._to_schema(obj) if obj else None
@@ -81,11 +164,20 @@ class ProjectRepository:
         person_id: int | None = None,
         order_by: OrderField = 'create_time',
         desc: bool = True,
+        after: tuple[datetime, int] | None = None,
     ) -> ProjectsPage:
         """
+        Если передан `after` (create_time, id последнего элемента
+        предыдущей страницы), используется keyset-пагинация.
+
+        Без фильтра по person_id общее количество берётся из счётчика
+        project_counts (поддерживается триггером), иначе считается
+        оконной функцией в том же запросе.
+
         SQL:
-        -- страница
-        SELECT p.*
+        SELECT p.*,
+               (SELECT n FROM project_counts WHERE key = :key)
+                 AS total_count  -- или COUNT(*) OVER ()
         FROM projects AS p
         WHERE (:status IS NULL OR p.status = :status)
           AND (:person_id IS NULL OR p.person_in_charge = :person_id)
@@ -100,15 +192,40 @@ class ProjectRepository:
                       END DESC
         LIMIT :per_page OFFSET :offset;
 
-        -- общее количество
+        -- только если страница пуста (вышли за пределы выборки)
+        SELECT n FROM project_counts WHERE key = :key;  -- или:
         SELECT COUNT(*)
         FROM projects AS p
         WHERE (:status IS NULL OR p.status = :status)
           AND (:person_id IS NULL OR p.person_in_charge = :person_id);
         """
         per_page = min(per_page, PER_PAGE_MAX)
+        if after is not None:
+            return await self._list_keyset(
+                page=page,
+                per_page=per_page,
+                status=status,
+                person_id=person_id,
+                desc=desc,
+                after=after,
+            )
 
-        stmt = select(Project)
+        key = self._count_key(status, person_id)
+        if key is not None:
+            count_stmt = select(ProjectCount.n).where(ProjectCount.key == key)
+            total_col = count_stmt.scalar_subquery()
+        else:
+            count_stmt = self._apply_filters(
+                select(func.count()).select_from(Project),
+                status=status,
+                person_id=person_id,
+            )
+            total_col = func.count().over()
+
+        stmt = select(
+            *(getattr(Project, f) for f in _READ_FIELDS),
+            total_col.label('total_count'),
+        )
         stmt = self._apply_filters(stmt, status=status, person_id=person_id)
         stmt = self._apply_order(stmt, order_by=order_by, desc=desc)
 
@@ -116,23 +233,72 @@ class ProjectRepository:
         page_res = await self.session.execute(
             stmt.offset(offset).limit(per_page)
         )
-        items: Sequence[Project] = page_res.scalars().all()
+        rows = page_res.all()
+        items = self._rows_to_schema(rows)
 
-        count_stmt = select(func.count()).select_from(
-            stmt.order_by(None).limit(None).offset(None).subquery()
-        )
-        total = (await self.session.execute(count_stmt)).scalar_one()
+        if rows:
+            total = rows[0].total_count or 0
+        elif offset:
+            total = (await self.session.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
 
         has_prev = page > 1
         has_next = offset + len(items) < total
 
         return ProjectsPage(
-            items=[self._to_schema(i) for i in items],
+            items=items,
             page=page,
             per_page=per_page,
             total_count=int(total),
             has_prev=has_prev,
             has_next=has_next,
+            next_cursor=self._next_cursor(
+                items, order_by=order_by, has_next=has_next
+            ),
+        )
+
+    async def _list_keyset(
+        self,
+        *,
+        page: int,
+        per_page: int,
+        status: str | None,
+        person_id: int | None,
+        desc: bool,
+        after: tuple[datetime, int],
+    ) -> ProjectsPage:
+        """
+        SQL:
+        SELECT p.*
+        FROM projects AS p
+        WHERE (:status IS NULL OR p.status = :status)
+          AND (:person_id IS NULL OR p.person_in_charge = :person_id)
+          AND (p.create_time, p.id) < (:after_time, :after_id)  -- > для ASC
+        ORDER BY p.create_time DESC, p.id DESC
+        LIMIT :per_page + 1;
+        """
+        key = tuple_(Project.create_time, Project.id)
+        stmt = select(*(getattr(Project, f) for f in _READ_FIELDS)).where(
+            key < tuple_(*after) if desc else key > tuple_(*after)
+        )
+        stmt = self._apply_filters(stmt, status=status, person_id=person_id)
+        stmt = self._apply_order(stmt, order_by='create_time', desc=desc)
+
+        rows = (await self.session.execute(stmt.limit(per_page + 1))).all()
+        has_next = len(rows) > per_page
+        items = self._rows_to_schema(rows[:per_page])
+
+        return ProjectsPage(
+            items=items,
+            page=page,
+            per_page=per_page,
+            total_count=None,
+            has_prev=True,
+            has_next=has_next,
+            next_cursor=self._next_cursor(
+                items, order_by='create_time', has_next=has_next
+            ),
         )
 
     # --------------------------- mutations ---------------------------
@@ -162,27 +328,109 @@ class ProjectRepository:
         """
         obj = Project(**payload.model_dump())
         self.session.add(obj)
+        # id и create_time (server_default) приходят через RETURNING
+        # при flush (eager_defaults='auto'), отдельный refresh не нужен
         await self.session.flush()
-        await self.session.refresh(obj)
         return self._to_schema(obj)
 
     async def create_many(
         self, payloads: Iterable[ProjectCreate]
     ) -> list[ProjectRead]:
         """
-        SQL (семантически; выполняется в цикле ORM):
+        SQL (одним multi-row INSERT):
         INSERT INTO projects (...columns...)
-        VALUES (...values...)
-        RETURNING *;  -- для каждой записи
-        """
-        created: list[ProjectRead] = []
-        for p in payloads:
-            obj = Project(**p.model_dump())
-            self.session.add(obj)
-            await self.session.flush()
-            await self.session.refresh(obj)
-            created.append(self._to_schema(obj))
-        return created
+        VALUES (...values_1...), (...values_2...), ...
+        RETURNING *;
+
+        Больше BULK_COPY_THRESHOLD записей загружаются через COPY
+        (см. `_copy_many`).
+        """
+        rows = [p.model_dump() for p in payloads]
+        if not rows:
+            return []
+        if len(rows) > BULK_COPY_THRESHOLD:
+            return await self._copy_many(rows)
+        stmt = insert(Project).returning(Project, sort_by_parameter_order=True)
+        res = await self.session.execute(stmt, rows)
+        # один проход валидации pydantic-core на весь список
+        return _READ_LIST_ADAPTER.validate_python(
+            res.scalars().all(), from_attributes=True
+        )
+
+    async def _copy_many(self, rows: list[dict]) -> list[ProjectRead]:
+        """
+        SQL:
+        CREATE TEMP TABLE projects_copy (
+            ord INTEGER,
+            name VARCHAR(255),
+            status project_status,
+            description TEXT,
+            person_in_charge INTEGER
+        ) ON COMMIT DROP;
+
+        COPY projects_copy (...columns...) FROM STDIN (FORMAT binary);
+
+        INSERT INTO projects (name, status, description, person_in_charge)
+        SELECT name, status, description, person_in_charge
+        FROM projects_copy
+        ORDER BY ord
+        RETURNING *;
+
+        DROP TABLE projects_copy;
+        """
+        await self.session.execute(
+            text(
+                f"""
+                CREATE TEMP TABLE {_COPY_TABLE.name} (
+                    ord INTEGER,
+                    name VARCHAR({NAME_MAX_LENGTH}),
+                    status project_status,
+                    description TEXT,
+                    person_in_charge INTEGER
+                ) ON COMMIT DROP
+                """
+            )
+        )
+        conn = await self.session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            _COPY_TABLE.name,
+            columns=[c.name for c in _COPY_TABLE.columns],
+            records=[
+                (
+                    i,
+                    r['name'],
+                    ProjectStatus(r['status']).name,
+                    r['description'],
+                    r['person_in_charge'],
+                )
+                for i, r in enumerate(rows)
+            ],
+        )
+
+        # ORDER BY ord: id из последовательности выдаются в порядке
+        # входных данных, как при sort_by_parameter_order в INSERT
+        data_cols = [c.name for c in _COPY_TABLE.columns if c.name != 'ord']
+        stmt = (
+            insert(Project)
+            .from_select(
+                data_cols,
+                select(*(_COPY_TABLE.c[c] for c in data_cols)).order_by(
+                    _COPY_TABLE.c.ord
+                ),
+            )
+            .returning(*(getattr(Project, f) for f in _READ_FIELDS))
+        )
+        created = (await self.session.execute(stmt)).all()
+        await self.session.execute(text(f'DROP TABLE {_COPY_TABLE.name}'))
+
+        # RETURNING не гарантирует порядок; name уникален (UNIQUE),
+        # поэтому восстанавливаем порядок входных данных по нему
+        position = {r['name']: i for i, r in enumerate(rows)}
+        created.sort(key=lambda row: position[row.name])
+        return _READ_LIST_ADAPTER.validate_python(
+            created, from_attributes=True
+        )
 
     async def update_one(
         self, project_id: int, payload: ProjectUpdate
@@ -200,50 +448,29 @@ class ProjectRepository:
         WHERE id = :project_id
         RETURNING *;
         """
-        res = await self.session.execute(
-            select(Project).where(Project.id == project_id).limit(1)
-        )
-        obj = res.scalar_one_or_none()
-        if obj is None:
-            return None
-
         data = payload.model_dump(exclude_unset=True)
         data.pop('create_time', None)
-        for k, v in data.items():
-            setattr(obj, k, v)
+        if not data:
+            return await self.get_by_id(project_id)
 
-        await self.session.flush()
-        await self.session.refresh(obj)
-        return self._to_schema(obj)
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**data)
+            .returning(Project)
+        )
+        obj = (await self.session.execute(stmt)).scalar_one_or_none()
+        return self._to_schema(obj) if obj else None
 
     async def delete_one(self, project_id: int) -> ProjectRead | None:
         """
         SQL:
         DELETE FROM projects
         WHERE id = :project_id
-        RETURNING *;  -- эмулируется через возврат ранее загруженного объекта
-        """
-        res = await self.session.execute(
-            select(Project).where(Project.id == project_id).limit(1)
-        )
-        obj = res.scalar_one_or_none()
-        if obj is None:
-            return None
-        await self.session.delete(obj)
-        return self._to_schema(obj)
-
-    async def exists_by_name(self, name: str) -> bool:
-        """Проверка существования проекта с таким именем.
-        SQL:
-        SELECT COUNT(*)
-        FROM projects
-        WHERE name = :name;
+        RETURNING *;
         """
         stmt = (
-            select(func.count())
-            .select_from(Project)
-            .where(Project.name == name)
+            delete(Project).where(Project.id == project_id).returning(Project)
         )
-        result = await self.session.execute(stmt)
-        count = result.scalar_one_or_none() or 0
-        return count > 0
+        obj = (await self.session.execute(stmt)).scalar_one_or_none()
+        return self._to_schema(obj) if obj else None
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.project.schemas import (
@@ -12,9 +14,18 @@ from apps.project.schemas import (
     ProjectsPage,
     ProjectUpdate,
 )
-from apps.project.services import ProjectService, fetch_external_posts
+from apps.project.services import (
+    ProjectService,
+    fetch_external_posts,
+    fetch_external_posts_bulk,
+)
 from apps.project.types import OrderField, ProjectStatus
-from core.constants import PAGE_DEFAULT, PER_PAGE_DEFAULT, PER_PAGE_MAX
+from core.constants import (
+    EXTERNAL_POSTS_MAX_PAGES,
+    PAGE_DEFAULT,
+    PER_PAGE_DEFAULT,
+    PER_PAGE_MAX,
+)
 from core.database import get_async_session
 from core.security import current_subject
 
@@ -26,6 +37,23 @@ projects_router = APIRouter(
 
 external_router = APIRouter(prefix='/external', tags=['external'])
 
+_BULK_ADAPTER = TypeAdapter(list[ProjectCreate])
+
+
+def _body_validation_error(exc: ValidationError) -> RequestValidationError:
+    """
+    Приводит ошибку валидации тела к виду, который FastAPI отдаёт для
+    остальных эндпоинтов: loc начинается с 'body', а сырое тело
+    невалидного JSON не возвращается клиенту.
+    """
+    errors = []
+    for err in exc.errors(include_url=False):
+        err['loc'] = ('body', *err['loc'])
+        if err['type'] == 'json_invalid':
+            err['input'] = {}
+        errors.append(err)
+    return RequestValidationError(errors)
+
 
 async def get_service(
     session: AsyncSession = Depends(get_async_session),
@@ -50,14 +78,23 @@ async def list_projects(
     person_id: int | None = Query(None),
     order_by: OrderField = Query('create_time'),
     desc: bool = Query(True),
-) -> ProjectsPage:
-    return await service.list_projects(
+    cursor: str | None = Query(
+        None, description='Курсор следующей страницы (next_cursor)'
+    ),
+) -> Response:
+    result = await service.list_projects(
         page=page,
         per_page=per_page,
         status=status,
         person_id=person_id,
         order_by=order_by,
         desc=desc,
+        cursor=cursor,
+    )
+    # сериализация сразу в JSON-байты в pydantic-core, минуя
+    # jsonable_encoder и стандартный json
+    return Response(
+        content=result.model_dump_json(), media_type='application/json'
     )
 
 
@@ -75,11 +112,32 @@ async def create_project(
     '/bulk',
     response_model=List[ProjectRead],
     status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'array',
+                        'items': {
+                            '$ref': '#/components/schemas/ProjectCreate'
+                        },
+                    }
+                }
+            },
+        }
+    },
 )
 async def create_projects_bulk(
-    payloads: List[ProjectCreate],
+    request: Request,
     service: ProjectService = Depends(get_service),
 ) -> List[ProjectRead]:
+    body = await request.body()
+    # разбор JSON и валидация списка за один проход в pydantic-core
+    try:
+        payloads = _BULK_ADAPTER.validate_json(body)
+    except ValidationError as exc:
+        raise _body_validation_error(exc) from exc
     return await service.create_many(payloads)
 
 
@@ -111,3 +169,22 @@ async def get_external_posts(
     user_id: int | None = Query(None, description='Фильтр по автору (userId)'),
 ):
     return await fetch_external_posts(limit=limit, page=page, user_id=user_id)
+
+
+@external_router.get(
+    '/posts/pages',
+    summary='Получить несколько страниц постов из внешнего API',
+)
+async def get_external_posts_pages(
+    pages: list[Annotated[int, Field(ge=1)]] = Query(
+        ...,
+        min_length=1,
+        max_length=EXTERNAL_POSTS_MAX_PAGES,
+        description='Номера страниц',
+    ),
+    limit: int = Query(10, ge=1, le=100, description='Постов на странице'),
+    user_id: int | None = Query(None, description='Фильтр по автору (userId)'),
+):
+    return await fetch_external_posts_bulk(
+        limit=limit, pages=pages, user_id=user_id
+    )
@@ -39,9 +39,10 @@ class ProjectsPage(BaseModel):
     items: List[ProjectRead]
     page: int
     per_page: int
-    total_count: int
+    total_count: int | None
     has_prev: bool
     has_next: bool
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Iterable
 
 import httpx
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.project.repository import ProjectRepository
@@ -15,14 +18,36 @@ from apps.project.schemas import (
     ProjectUpdate,
 )
 from apps.project.types import OrderField
-from apps.user.models import User
+from core.constants import (
+    EXTERNAL_API_TIMEOUT,
+    EXTERNAL_API_URL,
+    EXTERNAL_POSTS_CACHE_SIZE,
+    EXTERNAL_POSTS_CACHE_TTL,
+    PROJECTS_LIST_CACHE_SIZE,
+    PROJECTS_LIST_CACHE_TTL,
+)
 from core.exceptions import (
     IntegrityConflictException,
+    InvalidCursorException,
     ProjectNotFoundException,
 )
+from utils.cursor import decode_cursor
 
 logger = logging.getLogger(__name__)
 
+# Короткоживущий кэш страниц списка проектов (в пределах процесса);
+# сбрасывается при любом изменении проектов через сервис.
+_list_cache: dict[tuple, tuple[float, ProjectsPage]] = {}
+# Поколение кэша растёт при каждом сбросе: страница, прочитанная до
+# изменения, не должна попасть в кэш после него.
+_list_generation = 0
+
+
+def _invalidate_list_cache() -> None:
+    global _list_generation
+    _list_generation += 1
+    _list_cache.clear()
+
 
 class ProjectService:
     def __init__(self, session: AsyncSession) -> None:
@@ -46,39 +71,71 @@ class ProjectService:
         person_id: int | None = None,
         order_by: OrderField = 'create_time',
         desc: bool = True,
+        cursor: str | None = None,
     ) -> ProjectsPage:
-        return await self.repo.list_paginated(
+        key = (page, per_page, status, person_id, order_by, desc, cursor)
+        cached = _list_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        after = None
+        if cursor is not None:
+            if order_by != 'create_time':
+                raise InvalidCursorException(
+                    'Курсор поддерживается только для order_by=create_time'
+                )
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise InvalidCursorException()
+        generation = _list_generation
+        result = await self.repo.list_paginated(
             page=page,
             per_page=per_page,
             status=status,
             person_id=person_id,
             order_by=order_by,
             desc=desc,
+            after=after,
         )
 
+        if generation != _list_generation:
+            return result
+        if len(_list_cache) >= PROJECTS_LIST_CACHE_SIZE:
+            _list_cache.pop(next(iter(_list_cache)))
+        _list_cache[key] = (time.monotonic() + PROJECTS_LIST_CACHE_TTL, result)
+        return result
+
     # --------------------------- mutations ---------------------------
 
     async def create_one(self, payload: ProjectCreate) -> ProjectRead:
-        if await self.repo.exists_by_name(payload.name):
-            raise IntegrityConflictException(
-                'Проект с таким именем уже существует'
-            )
-        if payload.person_in_charge is not None:
-            user = await self.session.get(User, payload.person_in_charge)
-            if user is None:
+        """
+        Уникальность имени и существование ответственного проверяются
+        ограничениями БД (UNIQUE и FOREIGN KEY) при вставке.
+        """
+        try:
+            project = await self.repo.create_one(payload)
+        except IntegrityError as exc:
+            code = getattr(getattr(exc, 'orig', None), 'pgcode', None)
+            if code == '23505':
+                raise IntegrityConflictException(
+                    'Проект с таким именем уже существует'
+                ) from exc
+            if code == '23503':
                 raise IntegrityConflictException(
                     'Связанный пользователь (person_id) не найден'
-                )
-
-        project = await self.repo.create_one(payload)
+                ) from exc
+            raise
         await self.session.commit()
+        _invalidate_list_cache()
         return project
 
     async def create_many(
-        self, payloads: Iterable[ProjectCreate]
+        self, payloads: list[ProjectCreate]
     ) -> list[ProjectRead]:
-        projects = await self.repo.create_many(list(payloads))
+        projects = await self.repo.create_many(payloads)
         await self.session.commit()
+        _invalidate_list_cache()
         return projects
 
     async def update_one(
@@ -88,6 +145,7 @@ class ProjectService:
         if project is None:
             raise ProjectNotFoundException(project_id)
         await self.session.commit()
+        _invalidate_list_cache()
         return project
 
     async def delete_one(self, project_id: int) -> ProjectDeleteResponse:
@@ -95,21 +153,82 @@ class ProjectService:
         if project is None:
             raise ProjectNotFoundException(project_id)
         await self.session.commit()
+        _invalidate_list_cache()
         return ProjectDeleteResponse(**project.model_dump())
 
 
 # ----------------------------- external service ------------------------------
 
+_PostsKey = tuple[int, int, int | None]
+
+_client: httpx.AsyncClient | None = None
+_posts_cache: dict[_PostsKey, tuple[float, list[dict]]] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Общий клиент с пулом keep-alive соединений к внешнему API."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=EXTERNAL_API_URL,
+            timeout=EXTERNAL_API_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def start_external_client() -> None:
+    _get_client()
+
+
+async def close_external_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _posts_cache.clear()
+
 
 async def fetch_external_posts(
     *, limit: int = 10, page: int = 1, user_id: int | None = None
 ) -> list[dict]:
-    url = 'https://jsonplaceholder.typicode.com/posts'
+    key = (limit, page, user_id)
+    cached = _posts_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     params: dict[str, int] = {'_limit': limit, '_page': page}
     if user_id is not None:
         params['userId'] = user_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get('/posts', params=params)
+    response.raise_for_status()
+    posts = response.json()
+
+    if len(_posts_cache) >= EXTERNAL_POSTS_CACHE_SIZE:
+        _posts_cache.pop(next(iter(_posts_cache)))
+    _posts_cache[key] = (
+        time.monotonic() + EXTERNAL_POSTS_CACHE_TTL,
+        posts,
+    )
+    return posts
+
+
+async def fetch_external_posts_bulk(
+    *, limit: int = 10, pages: Iterable[int], user_id: int | None = None
+) -> list[list[dict]]:
+    """
+    Запрашивает несколько страниц параллельно через общий клиент.
+    Повторяющиеся номера запрашиваются один раз: параллельные ветки
+    gather одновременно промахиваются мимо кэша.
+    """
+    pages = list(pages)
+    unique = list(dict.fromkeys(pages))
+    results = await asyncio.gather(
+        *(
+            fetch_external_posts(limit=limit, page=p, user_id=user_id)
+            for p in unique
+        )
+    )
+    by_page = dict(zip(unique, results))
+    return [by_page[p] for p in pages]
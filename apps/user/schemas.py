@@ -14,7 +14,6 @@ from core.constants import (
     PASSWORD_MIN_LENGTH,
     USERNAME_MAX_LENGTH,
     USERNAME_MIN_LENGTH,
-    USERNAME_RE,
 )
 from utils.validators import (
     validate_full_name_value,
@@ -46,7 +45,7 @@ class UserBase(BaseModel):
     @field_validator('username')
     @classmethod
     def validate_username(cls, v: str) -> str:
-        return validate_username_value(v, USERNAME_RE)
+        return validate_username_value(v)
 
     @field_validator('full_name')
     @classmethod
@@ -89,7 +88,7 @@ class UserUpdate(BaseModel):
     def validate_username(cls, v: str | None) -> str | None:
         if v is None:
             return v
-        return validate_username_value(v, USERNAME_RE)
+        return validate_username_value(v)
 
     @field_validator('full_name')
     @classmethod
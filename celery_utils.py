@@ -6,6 +6,9 @@ from celery import Celery
 def make_celery():
     broker_url = getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
     result_backend = getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/1')
+    # задачи в основном ждут I/O: пул потоков не держит процесс на sleep
+    worker_pool = getenv('CELERY_WORKER_POOL', 'threads')
+    worker_concurrency = int(getenv('CELERY_WORKER_CONCURRENCY', '100'))
 
     celery = Celery(
         'worker',
@@ -19,6 +22,8 @@ def make_celery():
         accept_content=['json'],
         timezone='UTC',
         enable_utc=True,
+        worker_pool=worker_pool,
+        worker_concurrency=worker_concurrency,
     )
 
     return celery
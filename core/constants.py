@@ -1,9 +1,11 @@
-import re
+import string
 
 USERNAME_MIN_LENGTH = 3
 USERNAME_MAX_LENGTH = 30
 NAME_MAX_LENGTH = 255
-USERNAME_RE = re.compile(r'^[a-z0-9_.-]+$')
+USERNAME_ALLOWED_CHARS = frozenset(
+    string.ascii_lowercase + string.digits + '_.-'
+)
 
 FULL_NAME_MIN_LENGTH = 1
 FULL_NAME_MAX_LENGTH = 100
@@ -14,3 +16,13 @@ PASSWORD_MAX_LENGTH = 128
 PAGE_DEFAULT = 1
 PER_PAGE_DEFAULT = 10
 PER_PAGE_MAX = 50
+PROJECTS_LIST_CACHE_TTL = 10
+PROJECTS_LIST_CACHE_SIZE = 256
+
+BULK_COPY_THRESHOLD = 1000
+
+EXTERNAL_API_URL = 'https://jsonplaceholder.typicode.com'
+EXTERNAL_API_TIMEOUT = 5.0
+EXTERNAL_POSTS_CACHE_TTL = 30
+EXTERNAL_POSTS_CACHE_SIZE = 256
+EXTERNAL_POSTS_MAX_PAGES = 10
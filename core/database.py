@@ -1,3 +1,5 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -15,6 +17,9 @@ class Base(DeclarativeBase):
 engine = create_async_engine(
     settings.db_connection_url,
     echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
 )
 SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
@@ -22,6 +27,19 @@ SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
 )
 
 
+async def warm_up_pool(size: int = settings.DB_POOL_SIZE) -> None:
+    """
+    Заранее открывает `size` соединений, чтобы первые запросы после
+    старта не ждали установки соединений с БД.
+    """
+
+    async def _touch() -> None:
+        async with engine.connect():
+            pass
+
+    await asyncio.gather(*(_touch() for _ in range(size)))
+
+
 async def get_async_session() -> AsyncSession:
     async with SessionLocal() as session:
         yield session
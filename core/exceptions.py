@@ -48,6 +48,13 @@ class IntegrityConflictException(HTTPException):
         )
 
 
+class InvalidCursorException(HTTPException):
+    def __init__(self, detail: str = 'Некорректный курсор пагинации'):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+        )
+
+
 class InvalidCredentials(HTTPException):
     def __init__(self, detail: str = 'Неверный логин или пароль'):
         super().__init__(
@@ -15,6 +15,7 @@ EXCLUDE_PATHS: set[str] = {
     '/favicon.ico',
     '/metrics',
     '/api/v1/external/posts',
+    '/api/v1/external/posts/pages',
     '/api/v1/send-email',
 }
 
@@ -5,17 +5,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.middleware import Middleware
 
+from apps.project.services import (
+    close_external_client,
+    start_external_client,
+)
+from core.database import engine, warm_up_pool
 from core.exceptions import init_exception_handlers
 from core.logging_setup import logger
 from core.middleware.exc_middleware import DBErrorMiddleware
 from core.middleware.jwt_middleware import JWTAuthMiddleware
 from routers.api_v1_router import api_v1
+from settings.settings import settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.DB_POOL_WARMUP:
+        try:
+            await warm_up_pool()
+        except Exception as exc:
+            logger.warning('db_pool_warmup_failed', error=str(exc))
+    await start_external_client()
     logger.info('app_started')
     yield
+    await close_external_client()
+    await engine.dispose()
 
 
 middleware = [
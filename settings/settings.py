@@ -16,6 +16,10 @@ class Settings(BaseSettings):
     DB_NAME: str = 'alchemy_db'
     DB_NAME_TEST: str = 'alchemy_db_test'
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_WARMUP: bool = True
 
     SECRET_KEY: str = 'SECRET_KEY'
     ALGORITHM: str = 'HS256'
@@ -82,7 +82,7 @@ async def client(test_session):
 
     app.dependency_overrides[get_async_session] = _override_session
 
-    transport = httpx.ASGITransport(app=app, lifespan='on')
+    transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(
         transport=transport, base_url='http://test'
     ) as ac:
@@ -2,12 +2,22 @@ import httpx
 import pytest
 from httpx import Response
 
-from apps.project.services import fetch_external_posts
+from apps.project import services
+from apps.project.services import (
+    fetch_external_posts,
+    fetch_external_posts_bulk,
+)
 
 
-@pytest.mark.services
-async def test_fetch_external_posts(mocker):
-    """Тест асинхронного запроса к внешнему API с моками."""
+@pytest.fixture(autouse=True)
+def clear_posts_cache():
+    services._posts_cache.clear()
+    yield
+    services._posts_cache.clear()
+
+
+@pytest.fixture
+def mock_get(mocker):
     fake_data = [{'id': 1, 'title': 'mock post'}]
     url = 'https://jsonplaceholder.typicode.com/posts'
 
@@ -15,12 +25,49 @@ async def test_fetch_external_posts(mocker):
         200, json=fake_data, request=httpx.Request('GET', url)
     )
 
-    mock_get = mocker.patch(
+    return mocker.patch(
         'apps.project.services.httpx.AsyncClient.get',
         return_value=mock_response,
     )
 
+
+@pytest.mark.services
+async def test_fetch_external_posts(mock_get):
+    """Тест асинхронного запроса к внешнему API с моками."""
     result = await fetch_external_posts(limit=1)
 
-    assert result == fake_data
-    mock_get.assert_called_once_with(url, params={'_limit': 1, '_page': 1})
+    assert result == [{'id': 1, 'title': 'mock post'}]
+    mock_get.assert_called_once_with(
+        '/posts', params={'_limit': 1, '_page': 1}
+    )
+
+
+@pytest.mark.services
+async def test_fetch_external_posts_cached(mock_get):
+    """Повторный запрос с теми же параметрами берётся из кэша."""
+    first = await fetch_external_posts(limit=1)
+    second = await fetch_external_posts(limit=1)
+
+    assert first == second
+    mock_get.assert_called_once()
+
+
+@pytest.mark.services
+async def test_fetch_external_posts_bulk(mock_get):
+    """Каждая страница запрашивается отдельно, результат — по страницам."""
+    result = await fetch_external_posts_bulk(limit=1, pages=[1, 2, 3])
+
+    assert result == [[{'id': 1, 'title': 'mock post'}]] * 3
+    assert mock_get.call_count == 3
+    pages = {c.kwargs['params']['_page'] for c in mock_get.call_args_list}
+    assert pages == {1, 2, 3}
+
+
+@pytest.mark.services
+async def test_fetch_external_posts_bulk_dedupes_pages(mock_get):
+    """Повторяющиеся страницы запрашиваются один раз."""
+    result = await fetch_external_posts_bulk(limit=1, pages=[2, 1, 2])
+
+    assert len(result) == 3
+    assert result[0] is result[2]
+    assert mock_get.call_count == 2
@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from apps.project.models import Project
 from apps.project.repository import ProjectRepository
@@ -10,6 +12,8 @@ from apps.project.schemas import (
     ProjectUpdate,
 )
 from core.constants import PER_PAGE_MAX
+from core.database import Base
+from utils.cursor import decode_cursor
 
 
 @pytest.fixture
@@ -56,6 +60,34 @@ class TestProjectRepository:
         assert page2.has_prev is True
         assert page2.has_next is False
 
+    async def test_list_paginated_out_of_range(
+        self, repo: ProjectRepository, projects: list[ProjectRead]
+    ):
+        page = await repo.list_paginated(page=10, per_page=2)
+        assert page.items == []
+        assert page.total_count == len(projects)
+        assert page.has_prev is True
+        assert page.has_next is False
+
+    @pytest.mark.parametrize('desc', [True, False])
+    async def test_list_paginated_keyset(
+        self, repo: ProjectRepository, projects: list[ProjectRead], desc: bool
+    ):
+        full = await repo.list_paginated(per_page=10, desc=desc)
+        expected = [p.id for p in full.items]
+
+        page = await repo.list_paginated(per_page=2, desc=desc)
+        seen = [p.id for p in page.items]
+        while page.next_cursor:
+            page = await repo.list_paginated(
+                per_page=2, desc=desc, after=decode_cursor(page.next_cursor)
+            )
+            assert page.total_count is None
+            seen += [p.id for p in page.items]
+
+        assert seen == expected
+        assert page.has_next is False
+
     async def test_list_paginated_filters(
         self, repo: ProjectRepository, projects: list[ProjectRead]
     ):
@@ -67,6 +99,43 @@ class TestProjectRepository:
         assert len(page2.items) >= 1
         assert all(item.person_in_charge == pid for item in page2.items)
 
+    async def test_list_paginated_total_tracks_mutations(
+        self, repo: ProjectRepository, projects: list[ProjectRead]
+    ):
+        """total_count берётся из счётчика, обновляемого триггером."""
+        before = await repo.list_paginated(status='new', per_page=1)
+        await repo.update_one(projects[1].id, ProjectUpdate(status='new'))
+        await repo.delete_one(projects[0].id)
+
+        after = await repo.list_paginated(status='new', per_page=1)
+        assert after.total_count == before.total_count
+        everything = await repo.list_paginated(per_page=1)
+        assert everything.total_count == len(projects) - 1
+
+    async def test_counts_trigger_no_deadlock(self, db_engine):
+        """Вставки с разными статусами не блокируют счётчики крест-накрест."""
+
+        async def add(conn, name: str, status: str) -> None:
+            await conn.execute(
+                insert(Project).values(name=name, status=status)
+            )
+
+        async with db_engine.connect() as a, db_engine.connect() as b:
+            await a.begin()
+            await b.begin()
+            await add(a, 'lock-a-new', 'NEW')
+            other = asyncio.create_task(add(b, 'lock-b-done', 'COMPLETED'))
+            await asyncio.sleep(0.2)
+            await add(a, 'lock-a-done', 'COMPLETED')
+            await a.rollback()
+            await asyncio.wait_for(other, timeout=5)
+            await b.rollback()
+
+    async def test_create_all_is_repeatable(self, db_engine):
+        """Повторный create_all не пересоздаёт триггеры счётчиков."""
+        async with db_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
     async def test_list_paginated_ordering(
         self, repo: ProjectRepository, projects: list[ProjectRead]
     ):
@@ -102,6 +171,7 @@ class TestProjectRepository:
         created = await repo.create_one(payload)
         assert isinstance(created, ProjectRead)
         assert created.id is not None
+        assert created.create_time is not None
         assert created.name == payload.name
         assert created.status == payload.status
         assert created.description == payload.description
@@ -139,6 +209,37 @@ class TestProjectRepository:
         db_names = set(res.scalars().all())
         assert db_names == names
 
+    async def test_create_many_copy(
+        self,
+        repo: ProjectRepository,
+        test_session,
+        user,
+        monkeypatch,
+    ):
+        """Большие пачки загружаются через COPY."""
+        monkeypatch.setattr('apps.project.repository.BULK_COPY_THRESHOLD', 1)
+        payloads = [
+            ProjectCreate(
+                name=f'copy-{i}',
+                status='in_progress',
+                description=f'copy {i}',
+                person_in_charge=user.id,
+            )
+            for i in range(3)
+        ]
+        created = await repo.create_many(payloads)
+        assert [p.name for p in created] == [p.name for p in payloads]
+        ids = [p.id for p in created]
+        assert ids == sorted(ids)  # id выдаются в порядке входных данных
+        assert all(p.status == 'in_progress' for p in created)
+
+        res = await test_session.execute(
+            select(Project.name).where(
+                Project.name.in_([p.name for p in payloads])
+            )
+        )
+        assert set(res.scalars().all()) == {p.name for p in payloads}
+
     async def test_update_one(
         self, repo: ProjectRepository, test_session, project: ProjectRead
     ):
@@ -183,9 +284,3 @@ class TestProjectRepository:
 
         again = await repo.delete_one(project.id)
         assert again is None
-
-    async def test_exists_by_name(
-        self, repo: ProjectRepository, project: ProjectRead
-    ):
-        assert await repo.exists_by_name(project.name) is True
-        assert await repo.exists_by_name('non_existing_name') is False
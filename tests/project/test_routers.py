@@ -0,0 +1,96 @@
+from datetime import UTC, datetime, timedelta
+
+import jwt
+import pytest
+
+from apps.project.schemas import ProjectRead
+from core.security import ALGORITHM, SECRET_KEY
+
+BASE = '/api/v1/projects'
+
+
+@pytest.fixture
+def auth_headers(user) -> dict[str, str]:
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            'sub': str(user.id),
+            'type': 'access',
+            'jti': 'test',
+            'iat': int(now.timestamp()),
+            'exp': int((now + timedelta(minutes=5)).timestamp()),
+        },
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.mark.controllers
+class TestProjectRouters:
+    async def test_list_projects(
+        self, client, auth_headers, projects: list[ProjectRead]
+    ):
+        resp = await client.get(
+            f'{BASE}/', params={'per_page': 2}, headers=auth_headers
+        )
+        assert resp.status_code == 200
+        assert resp.headers['content-type'] == 'application/json'
+        body = resp.json()
+        assert body['total_count'] == len(projects)
+        assert len(body['items']) == 2
+        assert body['next_cursor'] is not None
+
+    async def test_create_projects_bulk(self, client, auth_headers, user):
+        payload = [
+            {'name': f'bulk-{i}', 'person_in_charge': user.id}
+            for i in range(2)
+        ]
+        resp = await client.post(
+            f'{BASE}/bulk', json=payload, headers=auth_headers
+        )
+        assert resp.status_code == 201
+        assert [p['name'] for p in resp.json()] == ['bulk-0', 'bulk-1']
+
+    async def test_create_projects_bulk_invalid_item(
+        self, client, auth_headers
+    ):
+        """Ошибка валидации имеет тот же вид, что и у POST /projects/."""
+        single = await client.post(f'{BASE}/', json={}, headers=auth_headers)
+        resp = await client.post(
+            f'{BASE}/bulk', json=[{}], headers=auth_headers
+        )
+        assert resp.status_code == 422
+        body = resp.json()
+        assert body['detail'] == single.json()['detail']
+        assert body['errors'][0]['loc'] == ['body', 0, 'name']
+        assert single.json()['errors'][0]['loc'] == ['body', 'name']
+
+    async def test_create_projects_bulk_malformed_json(
+        self, client, auth_headers
+    ):
+        raw = '[{"name": "secret-payload"'
+        resp = await client.post(
+            f'{BASE}/bulk',
+            content=raw,
+            headers={**auth_headers, 'Content-Type': 'application/json'},
+        )
+        assert resp.status_code == 422
+        body = resp.json()
+        assert body['detail'] == 'Некорректные данные запроса'
+        assert body['errors'][0]['loc'][0] == 'body'
+        assert 'secret-payload' not in resp.text
+
+    async def test_external_posts_pages_rejects_non_positive(
+        self, client, mocker
+    ):
+        fetch = mocker.patch('apps.project.routers.fetch_external_posts_bulk')
+        resp = await client.get(
+            '/api/v1/external/posts/pages', params={'pages': [1, 0, -3]}
+        )
+        assert resp.status_code == 422
+        assert [e['loc'] for e in resp.json()['errors']] == [
+            ['query', 'pages', 1],
+            ['query', 'pages', 2],
+        ]
+        fetch.assert_not_called()
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy import select
 
+from apps.project import services
 from apps.project.models import Project
 from apps.project.schemas import (
     ProjectCreate,
@@ -21,6 +22,13 @@ def project_service(test_session) -> ProjectService:
     return ProjectService(test_session)
 
 
+@pytest.fixture(autouse=True)
+def clear_list_cache():
+    services._list_cache.clear()
+    yield
+    services._list_cache.clear()
+
+
 @pytest.mark.services
 class TestProjectService:
     async def test_get_one_ok(
@@ -76,6 +84,44 @@ class TestProjectService:
         assert len(page.items) >= 1
         assert all(p.person_in_charge == person_id for p in page.items)
 
+    async def test_list_projects_cached_until_mutation(
+        self, project_service: ProjectService, projects: list[Project], user
+    ):
+        first = await project_service.list_projects(page=1, per_page=10)
+        second = await project_service.list_projects(page=1, per_page=10)
+        assert second is first
+
+        await project_service.create_one(
+            ProjectCreate(name='svc-cache', person_in_charge=user.id)
+        )
+        third = await project_service.list_projects(page=1, per_page=10)
+        assert third is not first
+        assert third.total_count == first.total_count + 1
+
+    async def test_list_projects_not_cached_if_mutated_meanwhile(
+        self,
+        project_service: ProjectService,
+        projects: list[Project],
+        monkeypatch,
+    ):
+        list_paginated = project_service.repo.list_paginated
+
+        async def read_then_mutate(**kwargs):
+            page = await list_paginated(**kwargs)
+            # изменение завершается между чтением страницы и записью в кэш
+            await project_service.delete_one(projects[0].id)
+            return page
+
+        monkeypatch.setattr(
+            project_service.repo, 'list_paginated', read_then_mutate
+        )
+        stale = await project_service.list_projects(page=1, per_page=10)
+        assert services._list_cache == {}
+
+        monkeypatch.undo()
+        fresh = await project_service.list_projects(page=1, per_page=10)
+        assert fresh.total_count == stale.total_count - 1
+
     async def test_create_one_ok(
         self, project_service: ProjectService, project: Project, user
     ):
@@ -0,0 +1,16 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(value: datetime, item_id: int) -> str:
+    raw = json.dumps({'v': value.isoformat(), 'id': item_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(data['v']), int(data['id'])
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError('некорректный курсор пагинации') from exc
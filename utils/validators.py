@@ -1,9 +1,14 @@
-import re
+from core.constants import USERNAME_ALLOWED_CHARS
 
 
-def validate_username_value(v: str, pattern: re.Pattern[str]) -> str:
+def is_valid_username(normalized: str) -> bool:
+    # проверка множеством вместо regex: без накладных расходов re на вызов
+    return bool(normalized) and USERNAME_ALLOWED_CHARS.issuperset(normalized)
+
+
+def validate_username_value(v: str) -> str:
     normalized = v.casefold().strip()
-    if not pattern.fullmatch(normalized):
+    if not is_valid_username(normalized):
         raise ValueError(
             'username может содержать только '
             "латинские буквы, цифры, символы '._-'"